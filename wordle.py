@@ -5,15 +5,21 @@ and a “play again?” prompt when the round ends.
 """
 
 # ─────────────────────────────  STANDARD LIB  ────────────────────────────
-import random, sys, urllib.request, urllib.error, math
+import marshal, random, re, sys, urllib.request, urllib.error, math
 from pathlib import Path
 
 # ──────────────────────────────  3RD-PARTY  ──────────────────────────────
 import pygame as pg      # pip install pygame
+# numpy (+ optional numba) are only imported by the bulk scorer, on first use
+np = None                # pip install numpy numba
 
 # ─────────────────────────────  WORD LIST  ───────────────────────────────
 WORD_LEN       = 5
+_A             = ord("a")
+_WORD_RE       = re.compile(rb"[a-z]{%d}\Z" % WORD_LEN).match  # bytes; anchored by match()
+_LETTERS_RE    = re.compile(rb"[a-z]*\Z").match
 WORDLIST_FILE  = "wordlist.txt"
+WORDLIST_CACHE = "wordlist.marshal"             # parsed (words, legal set) cache
 WORDLIST_URL   = (
     "https://raw.githubusercontent.com/tabatkins/wordle-list/main/words"
 )  # 2 315-word original answer set
@@ -37,16 +43,19 @@ def ensure_wordlist(path: str = WORDLIST_FILE) -> list[str]:
     """Return a clean 5-letter list – try local → online → fallback."""
     p = Path(path)
     if p.exists():
-        words = [w.strip().lower() for w in p.read_text().splitlines()]
-        words = [w for w in words if len(w) == WORD_LEN and w.isalpha()]
+        raw = p.read_bytes().splitlines()           # words are ASCII – decode survivors only
+        # one pass: clean, filter and dedupe together (order is irrelevant)
+        found = {w for l in raw if _WORD_RE(w := l.strip().lower())}
+        words = [w.decode("ascii") for w in found]
         if words:  # good file
             return words
 
     try:                                           # try online
         print("Fetching full word list …")
         with urllib.request.urlopen(WORDLIST_URL, timeout=8) as resp:
-            raw = resp.read().decode().splitlines()
-        words = [w.strip().lower() for w in raw if len(w) == WORD_LEN and w.isalpha()]
+            raw = resp.read().splitlines()
+        found = {w for l in raw if _WORD_RE(w := l.strip().lower())}
+        words = [w.decode("ascii") for w in found]
         Path(path).write_text("\n".join(words))
         print(f"✓ saved {len(words)} words to {path}")
     except Exception:
@@ -54,11 +63,104 @@ def ensure_wordlist(path: str = WORDLIST_FILE) -> list[str]:
         words = FALLBACK_WORDS
         try: Path(path).write_text("\n".join(words))
         except Exception: pass                     # sandbox read-only? ignore
-    return sorted(set(words))
-
-WORDS       = ensure_wordlist()
+    return words
+
+def _wordlist_stamp():
+    """(size, mtime_ns) of the text list the cache was built from, or None."""
+    try:
+        st = Path(WORDLIST_FILE).stat()
+        return (st.st_size, st.st_mtime_ns)
+    except OSError:
+        return None
+
+def load_words(path: str = WORDLIST_CACHE) -> tuple[list[str], frozenset[str]]:
+    """(words, legal set) – from the marshal cache, else parsed + cached."""
+    cache = Path(path)
+    try:
+        # marshal only builds plain data (no code runs on load) and keeps
+        # the strings interned + shared between list and set; the words were
+        # filtered before caching, so only the shape and source stamp are checked
+        stamp, words, legal = marshal.loads(cache.read_bytes())
+        if (stamp == _wordlist_stamp() and isinstance(words, list)
+                and isinstance(legal, frozenset) and words
+                and len(legal) == len(words)):
+            return words, legal
+    except Exception: pass                         # missing / stale / corrupt
+    words = [sys.intern(w) for w in ensure_wordlist()]
+    legal = frozenset(words)
+    try: cache.write_bytes(marshal.dumps((_wordlist_stamp(), words, legal)))
+    except Exception: pass                         # sandbox read-only? ignore
+    return words, legal
+
+WORDS, LEGAL_SET = load_words()
 TARGET_WORD = random.choice(WORDS)
-LEGAL_SET   = set(WORDS)
+
+# ────────────────────────────  BULK SCORING  ─────────────────────────────
+SCORE_CODES = {"gray": 0, "yellow": 1, "green": 2}
+_kernel     = None       # numba-compiled _score_rows; False when numba is missing
+
+def _load_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("bulk scoring needs numpy (pip install numpy)") from None
+        np = numpy
+
+def _jit_kernel():
+    """Compiled _score_rows (built once, on first use), or None without numba."""
+    global _kernel
+    if _kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _kernel = False
+        else:
+            _kernel = njit(cache=True)(_score_rows)
+    return _kernel or None
+
+def encode_words(words):
+    """N words → uint8[N, WORD_LEN] array of letter indices (a=0)."""
+    _load_numpy()
+    # whole-buffer check: right lengths + all-ASCII a-z; name the culprit if not
+    raw = "".join(words).encode()
+    if (len(raw) != WORD_LEN*len(words) or not _LETTERS_RE(raw)
+            or any(len(w) != WORD_LEN for w in words)):
+        bad = next(w for w in words if not _WORD_RE(w.encode()))
+        raise ValueError(f"not a {WORD_LEN}-letter lowercase word: {bad!r}")
+    return np.frombuffer(raw, np.uint8).reshape(-1, WORD_LEN) - _A
+
+def score_batch(guesses, targets):
+    """Score guesses[i] against targets[i] → uint8[N, WORD_LEN] of SCORE_CODES."""
+    if len(guesses) != len(targets):
+        raise ValueError(f"{len(guesses)} guesses vs {len(targets)} targets")
+    g, t = encode_words(guesses), encode_words(targets)
+    kernel = _jit_kernel()
+    if kernel is not None:
+        return kernel(g, t)
+    out = np.zeros(g.shape, np.uint8)              # no numba: same result, slower
+    for r, (gw, tw) in enumerate(zip(guesses, targets)):
+        out[r] = [SCORE_CODES[s] for s in Wordle.score(gw, tw)]
+    return out
+
+def _score_rows(g, t):
+    # same counts-array algorithm as Wordle.score, one row per pair;
+    # only ever run through numba (see _jit_kernel)
+    n, k = g.shape
+    out = np.zeros((n, k), np.uint8)
+    counts = np.empty(26, np.int64)
+    for r in range(n):
+        counts[:] = 0
+        for i in range(k):
+            counts[t[r, i]] += 1
+        for i in range(k):
+            if g[r, i] == t[r, i]:
+                out[r, i] = 2; counts[g[r, i]] -= 1
+        for i in range(k):
+            if out[r, i] == 0 and counts[g[r, i]] > 0:
+                out[r, i] = 1; counts[g[r, i]] -= 1
+    return out
 
 # ─────────────────────────────  APPEARANCE  ──────────────────────────────
 MAX_TRIES    = 6
@@ -81,17 +183,6 @@ SHADOW  = (0, 0, 0, 90)
 
 def colour(c): return {"green": GREEN, "yellow": YELLOW, "gray": GRAY}[c]
 
-# ───────────────────────────  FLIP ANIMATION  ────────────────────────────
-class TileReveal:
-    """Manage a single letter flip (0→1 progress)"""
-    def __init__(self, row, col, new_color, start_ms):
-        self.row, self.col = row, col
-        self.color   = new_color
-        self.start   = start_ms
-
-    def progress(self, now):
-        return max(0.0, min(1.0, (now - self.start) / FLIP_MS))
-
 # ─────────────────────────────-  GAME CLASS  ─────────────────────────────
 class Wordle:
     def __init__(self):
@@ -102,6 +193,35 @@ class Wordle:
         self.big    = pg.font.SysFont("arialblack", 54)
         self.med    = pg.font.SysFont("arialblack", 34)
         self.small  = pg.font.SysFont("arial", 26)
+        # cached art is converted to the display format up front so every
+        # blit hits SDL's matching-format fast path
+        self.glyph_cache = {ch: self.med.render(ch, True, (255,255,255)).convert_alpha()
+                            for ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
+        self.tile_cache: dict[tuple[tuple[int,int,int], str], pg.Surface] = {}
+        self.prompt_txt  = self.small.render("Play again?  Y / N", True, LETTER).convert_alpha()
+
+        self.shadow_surf = pg.Surface((TILE, TILE), pg.SRCALPHA)
+        self.shadow_surf.fill(SHADOW)
+        self.shadow_surf = self.shadow_surf.convert_alpha()
+        # grid background: BG with every drop shadow baked in, kept opaque so
+        # the per-frame blit is a plain copy rather than an alpha blend
+        self.shadow_layer = pg.Surface((WIDTH, HEIGHT-TOP))
+        self.shadow_layer.fill(BG)
+        for r in range(MAX_TRIES):
+            for c in range(WORD_LEN):
+                self.shadow_layer.blit(self.shadow_surf, self.rect_at(r,c).move(3, 4-TOP))
+        self.shadow_layer = self.shadow_layer.convert()
+        # scratch target for squashed mid-flip tiles (reused every frame)
+        self.anim_buf    = pg.Surface((TILE, TILE), pg.SRCALPHA).convert_alpha()
+
+        # static banner: subtle vertical gradient + title, built once
+        self.banner_bg = pg.Surface((WIDTH, TOP))
+        for y in range(TOP):
+            c = int(19 + (24-19)*y/TOP)
+            self.banner_bg.fill((c, c+2, c+5), rect=pg.Rect(0, y, WIDTH, 1))
+        title = self.big.render("WORDLE", True, (241,241,242))
+        self.banner_bg.blit(title, title.get_rect(center=(WIDTH//2, TOP//2)))
+        self.banner_bg = self.banner_bg.convert()
 
         self.new_round()
 
@@ -113,13 +233,24 @@ class Wordle:
         self.guesses: list[str]    = []
         self.results: list[list]   = []             # 'green' / 'yellow' / 'gray'
         self.current               = ""
-        self.reveals: list[TileReveal] = []
+        # per-tile flip state (None → nothing to animate): start ms, face colour
+        self.reveal_start = [[None]*WORD_LEN for _ in range(MAX_TRIES)]
+        self.reveal_color = [[None]*WORD_LEN for _ in range(MAX_TRIES)]
         self.message               = ""
         self.play_again_prompt     = False
         self.game_over             = False
+        self.dirty                 = True           # full redraw on next frame
+        self.flip_rects            = []             # tiles flipping last frame
+
+        # warm the tile cache: every letter on every face colour + blanks
+        for col in (EMPTY, GREEN, YELLOW, GRAY):
+            for ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+                self.tile(col, ch)
+            self.tile(col, "")
 
     # --------------------------  INPUT  ----------------------------------
     def handle_key(self, key, uni):
+        self.dirty = True
         if self.game_over:
             if key in (pg.K_y, pg.K_RETURN):
                 self.new_round()
@@ -136,7 +267,7 @@ class Wordle:
 
     # ------------------  GUESS VALIDATION & REVEAL SETUP  ----------------
     def submit_guess(self):
-        guess = self.current.lower()
+        guess = sys.intern(self.current.lower())
         if len(guess) != WORD_LEN:
             self.flash("Not enough letters!")
             return
@@ -150,7 +281,8 @@ class Wordle:
 
         # enqueue flip animations for each tile
         for i, s in enumerate(styles):
-            self.reveals.append(TileReveal(row, i, colour(s), stamp + i*STAGGER_MS))
+            self.reveal_start[row][i] = stamp + i*STAGGER_MS
+            self.reveal_color[row][i] = colour(s)
 
         self.guesses.append(guess)
         self.results.append(styles)
@@ -176,100 +308,124 @@ class Wordle:
     @staticmethod
     def score(guess, target):
         res = ["gray"]*WORD_LEN
-        pool = list(target)
-        for i,g in enumerate(guess):
-            if g == target[i]:
-                res[i] = "green"; pool[i] = None
-        for i,g in enumerate(guess):
-            if res[i]=="gray" and g in pool:
-                res[i] = "yellow"; pool[pool.index(g)] = None
+        counts = [0]*26                             # unclaimed target letters
+        for t in target:
+            counts[ord(t) - _A] += 1
+        for i in range(WORD_LEN):
+            if guess[i] == target[i]:
+                res[i] = "green"; counts[ord(guess[i]) - _A] -= 1
+        for i in range(WORD_LEN):
+            if res[i] == "gray":
+                idx = ord(guess[i]) - _A
+                if counts[idx] > 0:
+                    res[i] = "yellow"; counts[idx] -= 1
         return res
 
     # ------------------------  DRAWING  ---------------------------------
-    def draw(self):
-        self.screen.fill(BG)
-        self.draw_banner()
-        self.draw_tiles()
-        if self.play_again_prompt:
+    def draw(self, full=True):
+        """Compose a frame; unless `full`, present only the flipping tiles."""
+        self.draw_banner()              # banner + grid backgrounds cover the
+        rects = self.draw_tiles()       # whole window, so no fill(BG) needed
+        if self.play_again_prompt:      # board edges still show around it
             self.draw_prompt()
-        pg.display.flip()
+        if full:
+            pg.display.flip()
+        else:                           # last frame's too, so they land settled
+            pg.display.update(self.flip_rects + rects)
+        self.flip_rects = rects
 
     def draw_banner(self):
-        # subtle vertical gradient
-        banner = pg.Surface((WIDTH, TOP))
-        for y in range(TOP):
-            c = int(19 + (24-19)*y/TOP)
-            banner.fill((c, c+2, c+5), rect=pg.Rect(0, y, WIDTH, 1))
-        self.screen.blit(banner, (0,0))
-        title = self.big.render("WORDLE", True, (241,241,242))
-        self.screen.blit(title, title.get_rect(center=(WIDTH//2, TOP//2)))
+        self.screen.blit(self.banner_bg, (0,0))
 
         if self.message and not self.play_again_prompt:
             txt = self.small.render(self.message, True, LETTER)
             self.screen.blit(txt, txt.get_rect(midtop=(WIDTH//2, TOP-34)))
 
+    def tile(self, color, letter):
+        """Cached rounded tile with its glyph (keyed by face colour + letter)."""
+        surf = self.tile_cache.get((color, letter))
+        if surf is None:
+            surf = self._render_tile(color, letter)
+        return surf
+
+    def _render_tile(self, color, letter):
+        surf = pg.Surface((TILE, TILE), pg.SRCALPHA)
+        pg.draw.rect(surf, color, surf.get_rect(), border_radius=8)
+        if letter:
+            # A-Z are pre-rendered; anything else (Alt/AltGr letters…) on demand
+            txt = self.glyph_cache.get(letter) or self.med.render(letter, True, (255,255,255))
+            surf.blit(txt, txt.get_rect(center=(TILE//2, TILE//2)))
+        surf = surf.convert_alpha()                  # rounded corners stay clear
+        self.tile_cache[(color, letter)] = surf
+        return surf
+
     def draw_tiles(self):
         now = pg.time.get_ticks()
 
-        def rect_at(r,c):
-            x = GAP + c*(TILE+GAP)
-            y = TOP + GAP + r*(TILE+GAP)
-            return pg.Rect(x, y, TILE, TILE)
+        rect_at = self.rect_at
 
-        # shadow pass
-        shadow_surf = pg.Surface((TILE, TILE), pg.SRCALPHA)
-        shadow_surf.fill(SHADOW)
+        # collect every pass first, then hand each to SDL in one call
+        tile_pairs, flips, borders, dirty_rects = [], [], [], []
 
         for r in range(MAX_TRIES):
             for c in range(WORD_LEN):
                 rect = rect_at(r,c)
 
+                s = self.reveal_start[r][c]
+                prog = 1.0 if s is None else max(0.0, min(1.0, (now - s) / FLIP_MS))
+
                 base_col = EMPTY
                 letter   = ""
-                colorize = False
+                color    = self.reveal_color[r][c]
 
                 if r < len(self.guesses):
                     letter = self.guesses[r][c].upper()
                     # if reveal done, paint final colour
-                    if self.reveal_progress(r,c,now) >= 1:
-                        base_col = colour(self.results[r][c])
-                    colorize = True
+                    if prog >= 1:
+                        base_col = color
                 elif r == len(self.guesses) and c < len(self.current):
                     letter = self.current[c].upper()
 
-                # shadow
-                shadow_pos = rect.move(3,4)
-                self.screen.blit(shadow_surf, shadow_pos)
-
                 # flip animation: scale Y 1→0→1
-                prog = self.reveal_progress(r,c,now)
                 if 0 < prog < 1:
-                    scale = abs(1 - 2*prog)        # down to 0 then up
-                    surf  = pg.Surface((TILE, max(1,int(TILE*scale))))
-                    surf.fill(base_col if prog>0.5 else EMPTY)
-                    center = rect.center
-                    top = center[1] - surf.get_height()//2
-                    self.screen.blit(surf, (rect.left, top))
+                    # blank back, then the coloured face once past halfway
+                    front = prog > 0.5
+                    face  = self.tile(color if front else EMPTY, letter if front else "")
+                    h     = max(1, int(TILE*abs(1 - 2*prog)))   # down to 0 then up
+                    flips.append((face, h, (rect.left, rect.centery - h//2)))
+                    dirty_rects.append(rect)
                 else:
-                    pg.draw.rect(self.screen, base_col, rect, border_radius=8)
+                    # settled tile: rect + glyph come pre-rendered
+                    # (a tile still waiting on its stagger shows its back)
+                    face = letter if prog >= 1 else ""
+                    tile_pairs.append((self.tile(base_col, face), rect))
 
                 # border highlight for current row
                 if r == len(self.guesses) and not self.game_over:
-                    pg.draw.rect(self.screen, (86,87,89), rect, width=3, border_radius=8)
-
-                # letter
-                if letter and prog<0.5:  # hide letter while face is "back"
-                    continue
-                if letter:
-                    txt = self.med.render(letter, True, (255,255,255))
-                    self.screen.blit(txt, txt.get_rect(center=rect.center))
-
-    def reveal_progress(self, row, col, now):
-        """0→1 progress for given tile if animating, else 1 instantly."""
-        for rev in self.reveals:
-            if (rev.row,rev.col)==(row,col):
-                return rev.progress(now)
-        return 1.0
+                    borders.append(rect)
+
+        self.screen.blit(self.shadow_layer, (0, TOP))
+        self.blit_batch(tile_pairs)
+        for face, h, pos in flips:                 # share one scratch buffer
+            buf = self.anim_buf.subsurface((0, 0, TILE, h))
+            pg.transform.scale(face, (TILE, h), buf)
+            self.screen.blit(buf, pos)
+        for rect in borders:
+            pg.draw.rect(self.screen, (86,87,89), rect, width=3, border_radius=8)
+        return dirty_rects
+
+    @staticmethod
+    def rect_at(r, c):
+        x = GAP + c*(TILE+GAP)
+        y = TOP + GAP + r*(TILE+GAP)
+        return pg.Rect(x, y, TILE, TILE)
+
+    def blit_batch(self, pairs):
+        """Blit many (surface, dest) pairs in a single call."""
+        if hasattr(self.screen, "fblits"):          # pygame-ce
+            self.screen.fblits(pairs)
+        else:
+            self.screen.blits(pairs, doreturn=False)
 
     def draw_prompt(self):
         pad = 30
@@ -278,7 +434,7 @@ class Wordle:
         pg.draw.rect(self.screen, (100,100,105), box, width=4, border_radius=12)
 
         txt1 = self.med.render(self.message, True, (255,255,255))
-        txt2 = self.small.render("Play again?  Y / N", True, LETTER)
+        txt2 = self.prompt_txt
         self.screen.blit(txt1, txt1.get_rect(center=(WIDTH//2, HEIGHT//2-20)))
         self.screen.blit(txt2, txt2.get_rect(center=(WIDTH//2, HEIGHT//2+25)))
 
@@ -290,12 +446,25 @@ class Wordle:
                     self.quit()
                 elif event.type == pg.USEREVENT:          # clear flash
                     self.message = ""
+                    self.dirty   = True
                 elif event.type == pg.KEYDOWN:
                     self.handle_key(event.key, event.unicode)
-
-            self.draw()
+                elif event.type == pg.WINDOWEXPOSED:
+                    self.dirty = True
+
+            # idle frames (no input, no flip in flight) skip drawing entirely
+            animating = self._animating(pg.time.get_ticks())
+            # input/timers repaint everything; flips only push their tiles
+            if self.dirty or animating or self.flip_rects:
+                self.draw(full=self.dirty)
+                self.dirty = False
             self.clock.tick(FPS)
 
+    def _animating(self, now):
+        """True while any tile flip is pending or under way."""
+        return any(s is not None and now - s < FLIP_MS
+                   for row in self.reveal_start for s in row)
+
     @staticmethod
     def quit():
         pg.quit(); sys.exit()